@@ -1,65 +1,487 @@
 import sys
 import os
+import asyncio
 import subprocess
 import logging
-from google_play_scraper import app as fetch_app_details
+import re
+import sqlite3
+import threading
+import time
+import bisect
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from google_play_scraper.constants.request import Formats
+from google_play_scraper.features.app import parse_dom
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QListWidget, QListWidgetItem, 
-    QPushButton, QMessageBox, QLabel, QHBoxLayout, QProgressDialog
+    QApplication, QWidget, QVBoxLayout, QListView, QStyledItemDelegate, QStyle,
+    QPushButton, QMessageBox, QProgressDialog
 )
-from PyQt5.QtGui import QPixmap, QIcon, QFont
-from PyQt5.QtCore import Qt, QSize, QTimer
-import requests
+from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QPainter
+from PyQt5.QtCore import (
+    Qt, QSize, QRect, QTimer, QEvent, QAbstractListModel, QModelIndex, pyqtSignal
+)
+import httpx
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
-import contextlib
+import qasync
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-
-# Suppress console logs by redirecting stdout and stderr
-@contextlib.contextmanager
-def suppress_stdout_stderr():
-    with open(os.devnull, 'w') as devnull:
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = devnull
-        sys.stderr = devnull
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Shared HTTP/2 client: concurrent Google Play page and icon requests are
+# multiplexed as streams over one connection per host
+HTTP_CLIENT = httpx.AsyncClient(
+    http2=True, timeout=10, limits=httpx.Limits(max_keepalive_connections=16)
+)
+
+# Google Play starts answering 429/404 to unthrottled scraping
+PLAY_RPS = 5
+
+class _RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second, used with `async with`."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    async def __aenter__(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return self
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+PLAY_LIMITER = _RateLimiter(PLAY_RPS)
+
+# A `package:<name>` line of `pm list packages` output, matched on raw bytes
+_PKG_RE = re.compile(rb"^package:(.+?)\r?$", re.MULTILINE)
+
+# Per-package blocks in `dumpsys package packages` and the label line inside one
+_DUMPSYS_PACKAGE_RE = re.compile(r"^\s*Package \[([^\]]+)\]", re.MULTILINE)
+_DUMPSYS_LABEL_RE = re.compile(r"^\s*(?:applicationLabel|label)=(.+)$", re.MULTILINE)
+
+def parse_device_labels(dumpsys_output):
+    """Map package names to the app labels reported by `dumpsys package packages`."""
+    dumpsys_output = dumpsys_output.decode(errors="replace")
+    labels = {}
+    blocks = list(_DUMPSYS_PACKAGE_RE.finditer(dumpsys_output))
+    for block, next_block in zip(blocks, blocks[1:] + [None]):
+        end = next_block.start() if next_block else len(dumpsys_output)
+        label = _DUMPSYS_LABEL_RE.search(dumpsys_output, block.end(), end)
+        if label:
+            package_name = block.group(1)
+            label = label.group(1).strip()
+            # A label equal to the package name is no better than what we have
+            if label and label != package_name:
+                labels[package_name] = label
+    return labels
+
+async def run_adb(*args):
+    """Run an adb command without blocking the event loop; return (returncode, stdout, stderr)."""
+    process = await asyncio.create_subprocess_exec(
+        "adb", *args, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout, stderr
+
+class AdbError(Exception):
+    """Raised when the adb server rejects a request."""
+
+class AdbClient:
+    """Talk to the local adb server over its socket instead of spawning adb per command."""
+
+    def __init__(self, host="127.0.0.1", port=5037):
+        self.host = host
+        self.port = port
+
+    async def _open(self):
+        try:
+            return await asyncio.open_connection(self.host, self.port)
+        except OSError:
+            # Server is not running yet; let the adb binary start it once
+            logger.info("Starting adb server.")
+            # Its startup chatter goes to the child's own stdout/stderr
+            process = await asyncio.create_subprocess_exec(
+                "adb", "start-server", stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            await process.wait()
+            return await asyncio.open_connection(self.host, self.port)
+
+    @staticmethod
+    async def _read(reader, count):
+        """Read exactly count bytes, raising AdbError if the server hangs up."""
+        try:
+            return await reader.readexactly(count)
+        except asyncio.IncompleteReadError:
+            # e.g. `adb kill-server` mid-request
+            raise AdbError("adb server closed the connection") from None
+
+    async def _request(self, reader, writer, service):
+        """Send a length-prefixed service request and wait for OKAY."""
+        payload = service.encode()
+        writer.write(b"%04x" % len(payload) + payload)
+        await writer.drain()
+        status = await self._read(reader, 4)
+        if status != b"OKAY":
+            length = int(await self._read(reader, 4), 16)
+            message = await self._read(reader, length)
+            raise AdbError(message.decode(errors="replace"))
+
+    async def devices(self):
+        """Return the server's device list, one `serial\tstate` line per device."""
+        reader, writer = await self._open()
         try:
-            yield
+            await self._request(reader, writer, "host:devices")
+            length = int(await self._read(reader, 4), 16)
+            return (await self._read(reader, length)).decode()
         finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+            writer.close()
+
+    async def shell(self, command):
+        """Run a shell command on the single attached device and return its output bytes."""
+        reader, writer = await self._open()
+        try:
+            await self._request(reader, writer, "host:transport-any")
+            await self._request(reader, writer, "shell:" + command)
+            return await reader.read()
+        finally:
+            writer.close()
+
+    async def shell_lines(self, command):
+        """Run a shell command and yield its output lines as they arrive."""
+        reader, writer = await self._open()
+        try:
+            await self._request(reader, writer, "host:transport-any")
+            await self._request(reader, writer, "shell:" + command)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                yield line
+        finally:
+            writer.close()
+
+class _MetaCache:
+    """On-disk cache of app titles and scaled icons, keyed by package name."""
+
+    TTL = 7 * 24 * 60 * 60  # Refetch from Google Play after a week
+    # "Not on Google Play" may really be a throttled 404, so retry it sooner
+    NEGATIVE_TTL = 60 * 60
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "adbmanager", "meta.sqlite3")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Shared between worker threads and the GUI thread, guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS apps ("
+                "package TEXT PRIMARY KEY, ts REAL, title TEXT, icon_blob BLOB, found INTEGER DEFAULT 1)"
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(apps)")]
+            if "found" not in columns:
+                self._conn.execute("ALTER TABLE apps ADD COLUMN found INTEGER DEFAULT 1")
+
+    def get(self, package_name):
+        """Return (title, png_bytes) for a fresh entry, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ts, title, icon_blob, found FROM apps WHERE package = ?", (package_name,)
+            ).fetchone()
+        if row is None:
+            return None
+        ttl = self.TTL if row[3] else self.NEGATIVE_TTL
+        if time.time() - row[0] > ttl:
+            return None
+        return row[1], row[2]
+
+    def put(self, package_name, title, png_bytes, found=True):
+        """Store the title and scaled PNG icon for a package.
+
+        found=False records that Google Play does not know the package; such
+        entries expire after NEGATIVE_TTL instead of TTL.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO apps (package, ts, title, icon_blob, found) VALUES (?, ?, ?, ?, ?)",
+                (package_name, time.time(), title, png_bytes, int(found))
+            )
+
+class AppListModel(QAbstractListModel):
+    """Installed packages, with names and icons fetched only for rows that get shown."""
+
+    PackageRole = Qt.UserRole + 1
+    PIXMAP_CACHE_SIZE = 64  # Decoded icons kept around; a few screenfuls of rows
+
+    def __init__(self, fetch_meta, default_pixmap, parent=None):
+        super().__init__(parent)
+        self._fetch_meta = fetch_meta  # coroutine function: package -> (name, png_bytes, ok)
+        self._default_pixmap = default_pixmap
+        self._packages = []  # Sorted package names, one per row
+        self._meta = {}  # package name -> (app name, 64x64 PNG bytes or None)
+        self._pixmaps = OrderedDict()  # package name -> QPixmap, least recently used first
+        self._pending = set()
+        self._failed = set()  # Packages whose lookup failed; retried on the next refresh
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._packages)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        package_name = self._packages[index.row()]
+        if role == self.PackageRole:
+            return package_name
+        if role not in (Qt.DisplayRole, Qt.DecorationRole):
+            return None
+
+        # Side-effect free: keyboard search and accessibility query every row.
+        # Lookups are started by ensure_loaded() from the delegate's paint()
+        meta = self._meta.get(package_name)
+        if meta is None:
+            if role == Qt.DisplayRole:
+                return f"Loading... ({package_name})"
+            return self._default_pixmap
+        if role == Qt.DisplayRole:
+            return f"{meta[0]} ({package_name})"
+        return self._pixmap(package_name, meta[1])
+
+    def ensure_loaded(self, index):
+        """Start the lookup for a row that is being painted, if not already known."""
+        package_name = self._packages[index.row()]
+        if package_name not in self._meta:
+            self._request(package_name)
+
+    def packages(self):
+        """Return the set of package names currently in the list."""
+        return set(self._packages)
+
+    def has_package(self, package_name):
+        row = bisect.bisect_left(self._packages, package_name)
+        return row < len(self._packages) and self._packages[row] == package_name
+
+    def add_package(self, package_name):
+        row = bisect.bisect_left(self._packages, package_name)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._packages.insert(row, package_name)
+        self.endInsertRows()
+
+    def remove_package(self, package_name):
+        row = bisect.bisect_left(self._packages, package_name)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._packages[row]
+        self._meta.pop(package_name, None)
+        self._pixmaps.pop(package_name, None)
+        self._failed.discard(package_name)
+        self.endRemoveRows()
+
+    def retry_failed(self):
+        """Forget failed lookups so they are fetched again when next shown."""
+        for package_name in self._failed:
+            self._meta.pop(package_name, None)
+            self._pixmaps.pop(package_name, None)
+        self._failed.clear()
+        if self._packages:
+            self.dataChanged.emit(self.index(0), self.index(len(self._packages) - 1))
+
+    def _pixmap(self, package_name, png_bytes):
+        """Return the icon for a row, decoding it again if it was evicted."""
+        if not png_bytes:
+            return self._default_pixmap
+        pixmap = self._pixmaps.get(package_name)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(package_name)
+            return pixmap
+        pixmap = QPixmap()
+        pixmap.loadFromData(png_bytes, "PNG")
+        self._pixmaps[package_name] = pixmap
+        if len(self._pixmaps) > self.PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def _request(self, package_name):
+        if package_name not in self._pending:
+            self._pending.add(package_name)
+            asyncio.ensure_future(self._load(package_name))
+
+    async def _load(self, package_name):
+        try:
+            app_name, png_bytes, ok = await self._fetch_meta(package_name)
+        except Exception as e:
+            # Store a fallback so repaints don't refetch; the next refresh retries
+            logger.error("Failed to load details for %s: %s", package_name, e)
+            app_name, png_bytes, ok = "No Name Found", None, False
+        finally:
+            self._pending.discard(package_name)
+        # Skip packages that were uninstalled while their details loaded
+        if not self.has_package(package_name):
+            return
+        row = bisect.bisect_left(self._packages, package_name)
+        # Keep only the small PNG; the pixmap is decoded when the row is painted
+        self._meta[package_name] = (app_name, png_bytes)
+        if not ok:
+            self._failed.add(package_name)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.DecorationRole])
+
+class AppItemDelegate(QStyledItemDelegate):
+    """Paint a row as icon, label and an Uninstall button."""
+
+    uninstall_clicked = pyqtSignal(str)
+
+    MARGIN = 5
+    BUTTON_SIZE = QSize(90, 30)
+
+    # Built once and shared by every paint() call
+    _ROW_FONT = QFont("Arial", 12)
+    _BUTTON_FONT = QFont()
+    _BUTTON_FONT.setPixelSize(12)
+    _TEXT_COLOR = QColor("white")
+    _BUTTON_COLOR = QColor("#ff5555")
+    _BUTTON_HOVER_COLOR = QColor("#ff3333")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hovered_button = None  # Package whose button is under the mouse
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), 64 + 2 * self.MARGIN)
+
+    def _button_rect(self, rect):
+        size = self.BUTTON_SIZE
+        return QRect(
+            rect.right() - self.MARGIN - size.width(),
+            rect.top() + (rect.height() - size.height()) // 2,
+            size.width(), size.height()
+        )
+
+    def paint(self, painter, option, index):
+        # Only rows that actually get painted fetch their details
+        index.model().ensure_loaded(index)
+        painter.save()
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        rect = option.rect
+        icon_rect = QRect(rect.left() + self.MARGIN, rect.top() + self.MARGIN, 64, 64)
+        icon_pixmap = index.data(Qt.DecorationRole)
+        target = icon_pixmap.rect()
+        target.moveCenter(icon_rect.center())
+        painter.drawPixmap(target, icon_pixmap)
+
+        button_rect = self._button_rect(rect)
+        text_rect = QRect(icon_rect.right() + 10, rect.top(), 0, rect.height())
+        text_rect.setRight(button_rect.left() - self.MARGIN)
+        painter.setFont(self._ROW_FONT)
+        painter.setPen(self._TEXT_COLOR)
+        text = painter.fontMetrics().elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text)
+
+        hovered = self.hovered_button == index.data(AppListModel.PackageRole)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._BUTTON_HOVER_COLOR if hovered else self._BUTTON_COLOR)
+        painter.drawRoundedRect(button_rect, 6, 6)
+        painter.setFont(self._BUTTON_FONT)
+        painter.setPen(self._TEXT_COLOR)
+        painter.drawText(button_rect, Qt.AlignCenter, "Uninstall")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            package_name = index.data(AppListModel.PackageRole)
+            on_button = self._button_rect(option.rect).contains(event.pos())
+            hovered = package_name if on_button else None
+            if hovered != self.hovered_button:
+                self.hovered_button = hovered
+                if option.widget:
+                    option.widget.viewport().update()
+            if event.type() == QEvent.MouseButtonRelease and on_button and event.button() == Qt.LeftButton:
+                self.uninstall_clicked.emit(package_name)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def eventFilter(self, obj, event):
+        # editorEvent only sees the mouse over a row, so clear the hover when
+        # it leaves the viewport (e.g. onto the scrollbar next to the button)
+        if event.type() == QEvent.Leave and self.hovered_button is not None:
+            self.hovered_button = None
+            obj.update()
+        return super().eventFilter(obj, event)
 
 class ADBManager(QWidget):
+    # Scaled default icon, built once on first use
+    _default_pixmap = None
+
+    # Concurrent `adb install` processes when several APKs are dropped
+    MAX_PARALLEL_INSTALLS = 3
+
+    # Window-wide stylesheet, parsed once; ID selectors keep it off child dialogs
+    _STYLESHEET = """
+        QListView#appList {
+            background-color: #2e2e2e;
+            color: white;
+            border: none;
+        }
+        QPushButton#refreshButton {
+            background-color: #3b3b3b;
+            color: white;
+            font-size: 14px;
+            padding: 8px;
+            border-radius: 8px;
+        }
+        QPushButton#refreshButton:hover {
+            background-color: #555555;
+        }
+    """
+
     def __init__(self):
-        logging.info("Initializing ADBManager application.")
+        logger.info("Initializing ADBManager application.")
         super().__init__()
+        
+        # Thread pool for CPU-bound parsing, icon decoding and cache writes
+        self.executor = ThreadPoolExecutor(max_workers=16)
+        self.meta_cache = _MetaCache()
+        self.adb = AdbClient()
+        self.load_task = None
+        self.labels_task = None
         self.setWindowTitle("ADB Manager")
         self.setGeometry(300, 100, 600, 500)
         self.setAcceptDrops(True)  # Enable drag-and-drop for this widget
+        self.setStyleSheet(self._STYLESHEET)
         
         self.layout = QVBoxLayout()
         
-        # List Widget to show installed apps
-        self.app_list = QListWidget()
-        self.app_list.setStyleSheet("background-color: #2e2e2e; color: white; border: none;")
+        # List view to show installed apps; details load as rows scroll into view
+        self.app_model = AppListModel(
+            self._fetch_app_meta, self._get_default_pixmap(), self
+        )
+        self.app_delegate = AppItemDelegate(self)
+        self.app_delegate.uninstall_clicked.connect(
+            lambda package_name: asyncio.ensure_future(self.uninstall_app(package_name))
+        )
+        self.app_list = QListView()
+        self.app_list.setObjectName("appList")
+        self.app_list.setModel(self.app_model)
+        self.app_list.setItemDelegate(self.app_delegate)
+        self.app_list.setUniformItemSizes(True)  # Don't query every row for its size
+        self.app_list.setMouseTracking(True)
+        self.app_list.viewport().installEventFilter(self.app_delegate)
         self.layout.addWidget(self.app_list)
         
         # Refresh button to reload the app list
         refresh_button = QPushButton("Refresh App List")
-        refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3b3b3b;
-                color: white;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #555555;
-            }
-        """)
+        refresh_button.setObjectName("refreshButton")
         refresh_button.clicked.connect(self.load_apps_with_progress)
         self.layout.addWidget(refresh_button)
         
@@ -72,13 +494,13 @@ class ADBManager(QWidget):
         """Create a default icon if default_icon.png does not exist."""
         default_icon_path = os.path.join(os.path.dirname(__file__), "default_icon.png")
         if not os.path.exists(default_icon_path):
-            logging.info("Default icon not found. Generating default icon...")
+            logger.info("Default icon not found. Generating default icon...")
             image = Image.new("RGBA", (64, 64), (100, 100, 100, 255))  # Gray background
             draw = ImageDraw.Draw(image)
             try:
                 font = ImageFont.truetype("arial", 20)
             except IOError:
-                logging.warning("Arial font not found. Using default font.")
+                logger.warning("Arial font not found. Using default font.")
                 font = ImageFont.load_default()
             text = "APP"
             text_bbox = draw.textbbox((0, 0), text, font=font)
@@ -88,140 +510,220 @@ class ADBManager(QWidget):
             text_y = (image.height - text_height) // 2
             draw.text((text_x, text_y), text, fill=(255, 255, 255), font=font)
             image.save(default_icon_path)
-            logging.info("Default icon generated and saved.")
+            logger.info("Default icon generated and saved.")
         return default_icon_path
 
+    def _get_default_pixmap(self):
+        """Return the scaled default icon, loading it on first call."""
+        if ADBManager._default_pixmap is None:
+            pixmap = QPixmap(self.create_default_icon())
+            ADBManager._default_pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return ADBManager._default_pixmap
+
     def load_apps_with_progress(self):
         """Show progress bar and load apps."""
-        logging.info("Loading apps with progress dialog.")
+        logger.info("Loading apps with progress dialog.")
+        # A new refresh supersedes one that is still in flight
+        if self.load_task is not None and not self.load_task.done():
+            self.load_task.cancel()
+            self.progress_dialog.close()
         self.progress_dialog = QProgressDialog("Loading apps...", "Cancel", 0, 0, self)
         self.progress_dialog.setWindowTitle("Please Wait")
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.setMinimumDuration(500)  # Show after 0.5 seconds to avoid flicker
         self.progress_dialog.setValue(0)
-        QTimer.singleShot(100, self.load_apps)  # Start loading apps in background
+        self.progress_dialog.canceled.connect(self.cancel_load)
+        # Rows whose lookup failed (e.g. while offline) are fetched again
+        self.app_model.retry_failed()
+        self.load_task = asyncio.ensure_future(self.load_apps())
+
+    def cancel_load(self):
+        """Stop the in-flight refresh when the progress dialog is cancelled."""
+        # Closing the dialog also emits canceled, including from load_apps itself
+        if self.load_task is not None and self.load_task is not asyncio.current_task():
+            self.load_task.cancel()
+
+    def show_message(self, box, title, text):
+        """Show a message box once the current coroutine step has finished.
 
-    def load_apps(self):
+        A modal box runs a nested event loop; opening it from inside a task
+        would let qasync step other tasks re-entrantly.
+        """
+        QTimer.singleShot(0, lambda: box(self, title, text))
+
+    async def load_apps(self):
         """Load the list of installed apps with icons and names."""
-        logging.info("Starting to load apps.")
-        self.app_list.clear()
+        logger.info("Starting to load apps.")
 
-        # Check if ADB is connected (this will be silent due to suppression)
-        with suppress_stdout_stderr():
-            self.check_adb_connection()
-        
-        # Get the list of installed packages
-        logging.info("Fetching list of installed packages via ADB.")
-        process = subprocess.Popen(
-            ["adb", "shell", "pm", "list", "packages", "-3"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        stdout, stderr = process.communicate()
+        if not await self.check_adb_connection():
+            self.progress_dialog.cancel()
+            return
         
-        if stderr:
-            logging.error("Error while loading apps: %s", stderr.decode())
-            QMessageBox.critical(self, "Error", "Failed to load apps. Make sure ADB is running and the device is connected.")
+        packages = await self._scan_packages()
+        if packages is None:
+            self.show_message(QMessageBox.critical, "Error", "Failed to load apps. Make sure ADB is running and the device is connected.")
             self.progress_dialog.cancel()
             return
 
-        packages = stdout.decode().strip().splitlines()
         if not packages:
-            logging.warning("No apps found or failed to retrieve the app list.")
-            QMessageBox.warning(self, "Warning", "No apps found or failed to retrieve the app list.")
+            logger.warning("No apps found or failed to retrieve the app list.")
+            self.show_message(QMessageBox.warning, "Warning", "No apps found or failed to retrieve the app list.")
             self.progress_dialog.cancel()
             return
 
-        for package_line in packages:
-            package_name = package_line.split(":")[-1]
-            logging.info("Adding app to list: %s", package_name)
-            self.add_app_item(package_name)
-
-        logging.info("Finished loading apps.")
+        logger.info("Finished loading apps.")
         self.progress_dialog.close()
 
-    def add_app_item(self, package_name):
-        """Fetch app name and icon from Google Play, then add item to the list."""
-        app_name = "No Name Found"
-        
-        # Load or generate default icon
-        default_icon_path = self.create_default_icon()
-        icon_pixmap = QPixmap(default_icon_path)
-        icon_pixmap = icon_pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        
+    async def _scan_packages(self):
+        """Stream the installed third-party packages into the list.
+
+        Rows are added as `pm list packages` prints them, so details for the
+        first visible rows are already being fetched while the rest of the
+        list comes in. Returns the set of packages, or None if ADB failed.
+        """
+        logger.info("Fetching list of installed packages via ADB.")
+        # New packages may come with new labels; read them again on demand
+        self.labels_task = None
+        packages = set()
         try:
-            app_details = fetch_app_details(package_name)
-            app_name = app_details.get("title", app_name)
+            async for line in self.adb.shell_lines("pm list packages -3"):
+                match = _PKG_RE.match(line)
+                if match:
+                    package_name = match.group(1).decode()
+                    packages.add(package_name)
+                    if not self.app_model.has_package(package_name):
+                        self.app_model.add_package(package_name)
+        except (AdbError, OSError) as e:
+            logger.error("Error while loading apps: %s", e)
+            return None
+        self._reconcile(packages)
+        return packages
+
+    def _reconcile(self, packages):
+        """Remove rows for packages that are no longer in the given set.
+
+        Rows are added by _scan_packages as they stream in, so only removals
+        are left to do here; unchanged rows are left alone.
+        """
+        for package_name in self.app_model.packages() - packages:
+            self.app_model.remove_package(package_name)
+
+    async def _device_label(self, package_name):
+        """Return the label the device reports for a package, if any.
+
+        The dumpsys read is only started on the first cache miss after a scan
+        and is shared by every lookup until the next one.
+        """
+        if self.labels_task is None:
+            self.labels_task = asyncio.ensure_future(self.fetch_device_labels())
+        # Shielded so a cancelled row fetch does not cancel the shared read
+        labels = await asyncio.shield(self.labels_task)
+        return labels.get(package_name)
+
+    async def fetch_device_labels(self):
+        """Read app labels for all packages from the device in one ADB call."""
+        logger.info("Fetching app labels from the device.")
+        try:
+            stdout = await self.adb.shell("dumpsys package packages")
+        except (AdbError, OSError) as e:
+            logger.warning("Failed to read app labels from the device: %s", e)
+            return {}
+        # dumpsys output runs to megabytes, so keep its parsing off the GUI thread
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, parse_device_labels, stdout)
+
+    async def _fetch_app_meta(self, package_name):
+        """Fetch app name and icon bytes, from the cache or Google Play.
+
+        A label read from the device takes precedence over the Google Play
+        title, so apps that are not on the store still get a proper name.
+        Page parsing and icon decoding run on the thread pool. Returns
+        (app_name, png_bytes, ok); ok is False when the lookup failed and
+        should be retried on the next refresh.
+        """
+        cached = self.meta_cache.get(package_name)
+        if cached is not None:
+            return cached[0], cached[1], True
+
+        loop = asyncio.get_event_loop()
+        device_label = await self._device_label(package_name)
+        app_name = device_label or "No Name Found"
+        png_bytes = None
+        try:
+            # Same page and parser google_play_scraper.app() uses, fetched over HTTP/2
+            url = Formats.Detail.build(app_id=package_name, lang="en", country="us")
+            # Only cache misses get here, so cached rows never wait on the limiter
+            async with PLAY_LIMITER:
+                response = await HTTP_CLIENT.get(url)
+            if response.status_code == 404:
+                url = Formats.Detail.fallback_build(app_id=package_name, lang="en")
+                async with PLAY_LIMITER:
+                    response = await HTTP_CLIENT.get(url)
+            found = response.status_code != 404
+            if not found:
+                # Not on the store (e.g. sideloaded); cached briefly so the
+                # next launches don't ask again
+                app_details = {}
+            else:
+                response.raise_for_status()
+                app_details = await loop.run_in_executor(
+                    self.executor, parse_dom, response.text, package_name, url
+                )
+            app_name = device_label or app_details.get("title") or app_name
             icon_url = app_details.get("icon")
             if icon_url:
-                logging.info("Fetching icon for %s", package_name)
-                response = requests.get(icon_url)
-                icon_pixmap = QPixmap()
-                icon_pixmap.loadFromData(BytesIO(response.content).read())
-                icon_pixmap = icon_pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                logger.debug("Fetching icon for %s", package_name)
+                async with PLAY_LIMITER:
+                    response = await HTTP_CLIENT.get(icon_url)
+                response.raise_for_status()
+                png_bytes = await loop.run_in_executor(self.executor, self._thumbnail_png, response.content)
+            await loop.run_in_executor(
+                self.executor, self.meta_cache.put, package_name, app_name, png_bytes, found
+            )
         except Exception as e:
-            logging.error("Failed to fetch details for %s: %s", package_name, e)
+            logger.error("Failed to fetch details for %s: %s", package_name, e)
+            return app_name, png_bytes, False
+        return app_name, png_bytes, True
 
-        # Set up the list item layout
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        icon_label = QLabel()
-        icon_label.setPixmap(icon_pixmap)
-        
-        text_label = QLabel(f"{app_name} ({package_name})")
-        text_label.setFont(QFont("Arial", 12))
-        text_label.setStyleSheet("color: white; padding-left: 10px;")
-        
-        uninstall_button = QPushButton("Uninstall")
-        uninstall_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff5555;
-                color: white;
-                font-size: 12px;
-                padding: 6px 12px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #ff3333;
-            }
-        """)
-        uninstall_button.setFixedSize(QSize(90, 30))
-        uninstall_button.clicked.connect(lambda: self.uninstall_app(package_name))
-        
-        layout.addWidget(icon_label)
-        layout.addWidget(text_label)
-        layout.addStretch()
-        layout.addWidget(uninstall_button)
-        
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(widget.sizeHint())
-        self.app_list.addItem(list_item)
-        self.app_list.setItemWidget(list_item, widget)
-        logging.info("App %s added to list.", package_name)
+    @staticmethod
+    def _thumbnail_png(image_bytes):
+        """Decode an icon and scale it to 64x64 PNG bytes; runs in a worker thread.
+
+        Doing this off the GUI thread leaves it only a PNG load per row.
+        """
+        image = Image.open(BytesIO(image_bytes)).convert("RGBA")
+        image.thumbnail((64, 64), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, "PNG")
+        return buffer.getvalue()
 
-    def uninstall_app(self, package_name):
+    async def uninstall_app(self, package_name):
         """Uninstall the selected app."""
-        logging.info("Uninstalling app: %s", package_name)
-        process = subprocess.run(["adb", "uninstall", package_name], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if process.returncode == 0:
-            logging.info("App %s uninstalled successfully.", package_name)
+        logger.info("Uninstalling app: %s", package_name)
+        try:
+            output = await self.adb.shell("pm uninstall " + package_name)
+        except (AdbError, OSError) as e:
+            output = str(e).encode()
+        if output.strip().startswith(b"Success"):
+            logger.info("App %s uninstalled successfully.", package_name)
+            self._reconcile(self.app_model.packages() - {package_name})
         else:
-            logging.error("Failed to uninstall app %s: %s", package_name, process.stderr.decode())
-        
-        self.load_apps_with_progress()
+            logger.error("Failed to uninstall app %s: %s", package_name, output.decode(errors="replace"))
 
-    def check_adb_connection(self):
-        """Check ADB connection silently."""
-        logging.info("Checking ADB connection.")
-        process = subprocess.Popen(["adb", "devices"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
+    async def check_adb_connection(self):
+        """Check ADB connection silently; return True if a device is attached."""
+        logger.info("Checking ADB connection.")
+        try:
+            devices = await self.adb.devices()
+        except (AdbError, OSError):
+            devices = ""
         
-        if "device" not in stdout.decode():
-            logging.warning("No ADB device connected.")
-            QMessageBox.critical(self, "Error", "No device connected. Please ensure your device is connected and ADB is enabled.")
-            return
-        logging.info("ADB device connected.")
+        if "device" not in devices:
+            logger.warning("No ADB device connected.")
+            self.show_message(QMessageBox.critical, "Error", "No device connected. Please ensure your device is connected and ADB is enabled.")
+            return False
+        logger.info("ADB device connected.")
+        return True
 
     def dragEnterEvent(self, event):
         """Enable drag-and-drop for APK files."""
@@ -229,34 +731,60 @@ class ADBManager(QWidget):
             event.acceptProposedAction()
     
     def dropEvent(self, event):
-        """Install APK when an APK file is dropped."""
-        for url in event.mimeData().urls():
-            apk_path = url.toLocalFile()
-            if apk_path.endswith(".apk"):
-                logging.info("APK dropped for installation: %s", apk_path)
-                self.install_apk(apk_path)
-    
-    def install_apk(self, apk_path):
-        """Install APK on the device."""
+        """Install the APK files dropped on the window after a single confirmation."""
+        apk_paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        apk_paths = [apk_path for apk_path in apk_paths if apk_path.endswith(".apk")]
+        if not apk_paths:
+            return
+        logger.info("APKs dropped for installation: %s", apk_paths)
+        names = ", ".join(os.path.basename(apk_path) for apk_path in apk_paths)
         reply = QMessageBox.question(
-            self, "Install APK", f"Do you want to install {os.path.basename(apk_path)}?",
+            self, "Install APK", f"Do you want to install {names}?",
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            logging.info("Installing APK: %s", apk_path)
-            process = subprocess.run(["adb", "install", apk_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if process.returncode == 0:
-                logging.info("APK %s installed successfully.", apk_path)
-                QMessageBox.information(self, "Success", f"{os.path.basename(apk_path)} installed successfully.")
-            else:
-                logging.error("Failed to install APK %s: %s", apk_path, process.stderr.decode())
-                QMessageBox.critical(self, "Error", f"Failed to install {os.path.basename(apk_path)}.")
-            self.load_apps_with_progress()
+            asyncio.ensure_future(self.install_apks(apk_paths))
+
+    async def install_apks(self, apk_paths):
+        """Install several APKs concurrently, then refresh the list once."""
+        slots = asyncio.Semaphore(self.MAX_PARALLEL_INSTALLS)
+
+        async def install(apk_path):
+            async with slots:
+                return await self.install_apk(apk_path)
+
+        results = await asyncio.gather(*(install(apk_path) for apk_path in apk_paths))
+        installed = [os.path.basename(p) for p, ok in zip(apk_paths, results) if ok]
+        failed = [os.path.basename(p) for p, ok in zip(apk_paths, results) if not ok]
+        if installed:
+            self.show_message(QMessageBox.information, "Success", f"{', '.join(installed)} installed successfully.")
+            # Rescan so the new packages get rows; existing rows are kept
+            await self._scan_packages()
+        if failed:
+            self.show_message(QMessageBox.critical, "Error", f"Failed to install {', '.join(failed)}.")
+    
+    async def install_apk(self, apk_path):
+        """Install APK on the device; return True on success."""
+        logger.info("Installing APK: %s", apk_path)
+        try:
+            returncode, stdout, stderr = await run_adb("install", apk_path)
+        except OSError as e:
+            # e.g. adb is not on PATH
+            logger.error("Failed to install APK %s: %s", apk_path, e)
+            return False
+        if returncode != 0:
+            logger.error("Failed to install APK %s: %s", apk_path, stderr.decode())
+            return False
+        logger.info("APK %s installed successfully.", apk_path)
+        return True
 
 # Run the application
-with suppress_stdout_stderr():
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    manager = ADBManager()
-    manager.show()
-    sys.exit(app.exec_())
+app = QApplication(sys.argv)
+app.setStyle("Fusion")
+# Qt-aware asyncio loop so ADB and network I/O never block the GUI
+loop = qasync.QEventLoop(app)
+asyncio.set_event_loop(loop)
+manager = ADBManager()
+manager.show()
+with loop:
+    sys.exit(loop.run_forever())